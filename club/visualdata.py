@@ -7,8 +7,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from matplotlib.patches import Rectangle, Circle
+from matplotlib._pylab_helpers import Gcf
 import seaborn as sns
 from scipy import stats
+from scipy.optimize import curve_fit
+import copy
+import functools
+from collections import OrderedDict
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -48,6 +53,53 @@ plt.rcParams.update({
 # PROCESAMIENTO DE DATOS
 # ===========================================
 
+class SeriesData:
+    """
+    Datos columnares de varias series almacenados en un único array 2-D
+    
+    Las series de distinta longitud se rellenan con NaN, de modo que todas
+    las estadísticas se calculan en una sola pasada vectorizada por filas.
+    """
+    
+    def __init__(self, x, values, names):
+        self.x = np.asarray(x, dtype=float)              # (n_puntos,)
+        self.values = np.asarray(values, dtype=float)    # (n_series, n_puntos)
+        self.names = list(names)
+    
+    @property
+    def n_series(self):
+        return self.values.shape[0]
+    
+    @property
+    def mask(self):
+        """Máscara booleana de valores válidos (no NaN) por serie"""
+        return np.isfinite(self.values)
+    
+    def series(self, i):
+        """Devuelve (x, y) de la serie i sin los valores de relleno"""
+        valid = self.mask[i]
+        return self.x[valid], self.values[i, valid]
+    
+    def box_statistics(self):
+        """
+        Calcula las estadísticas descriptivas de todas las series a la vez
+        
+        Returns:
+            dict: arrays con una entrada por serie
+        """
+        q0, q1, median, q3, q4 = np.nanpercentile(self.values, [0, 25, 50, 75, 100], axis=1)
+        return {
+            'Media': np.nanmean(self.values, axis=1),
+            'Mediana': median,
+            'Q1': q1,
+            'Q3': q3,
+            'IQR': q3 - q1,
+            'Desv. Estándar': np.nanstd(self.values, axis=1),
+            'Mínimo': q0,
+            'Máximo': q4,
+            'Rango': q4 - q0
+        }
+
 class DataProcessor:
     """Clase para procesar y validar datos de entrada"""
     
@@ -57,16 +109,29 @@ class DataProcessor:
         Procesa los datos de entrada y los convierte en arrays numpy
         
         Args:
-            chart_data (str): Datos en formato CSV o pares x,y separados por ;
+            chart_data (str): Datos en formato CSV, pares x,y separados por ;
+                o varias series en uno de estos formatos:
+                - Columnas con x compartida: "x,y1,y2,...;x,y1,y2,..."
+                  (una primera fila no numérica se usa como nombres)
+                - Series con nombre: "Grupo A: 1,2,3 | Grupo B: 4,5,6"
         
         Returns:
-            tuple: (x_data, y_data) o (data,) para datos unidimensionales
+            tuple: (x_data, y_data) o (data,) para datos unidimensionales,
+                o SeriesData para varias series
         """
         try:
             if not chart_data or chart_data.strip() == "":
                 raise ValueError("Los datos están vacíos")
             
+            if DataProcessor._is_named_series(chart_data):
+                return DataProcessor._process_named_series(chart_data)
+            
             if ';' in chart_data:
+                rows = [row.split(',') for row in chart_data.split(';') if row.strip()]
+                columns = DataProcessor._process_columns(rows)
+                if columns is not None:
+                    return columns
+                
                 # Datos bidimensionales (x,y pairs)
                 pairs = [pair.split(',') for pair in chart_data.split(';')]
                 x_data = []
@@ -105,6 +170,103 @@ class DataProcessor:
             print(f"❌ Error procesando datos: {e}")
             return None
     
+    @staticmethod
+    def _is_named_series(chart_data):
+        """
+        Indica si los datos son series con nombre: separadas por | o, sin
+        filas con ;, un único bloque con prefijo "nombre:"
+        """
+        if '|' in chart_data:
+            return True
+        if ';' in chart_data or ':' not in chart_data:
+            return False
+        name = chart_data.split(':', 1)[0].strip()
+        return bool(name) and ',' not in name
+    
+    @staticmethod
+    def _numeric_row(row):
+        """Convierte las celdas no vacías de una fila a float, o None si alguna no es numérica"""
+        try:
+            return [float(cell.strip()) for cell in row if cell.strip()]
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _process_columns(rows):
+        """
+        Convierte filas "x,y1,y2,..." en un SeriesData con x compartida
+        
+        Returns:
+            SeriesData, o None si alguna fila no tiene al menos 3 celdas
+            numéricas (en ese caso los datos se tratan como pares x,y)
+        """
+        if not rows:
+            return None
+        
+        header = None
+        if DataProcessor._numeric_row(rows[0]) is None:
+            header = [cell.strip() for cell in rows[0]]
+            rows = rows[1:]
+        
+        table = [DataProcessor._numeric_row(row) for row in rows]
+        if not table or any(row is None or len(row) < 3 for row in table):
+            return None
+        
+        # Rellenar con NaN las filas más cortas para no perder columnas
+        n_columns = max(len(row) for row in table)
+        table = np.array([row + [np.nan] * (n_columns - len(row)) for row in table])
+        order = np.argsort(table[:, 0], kind='stable')
+        table = table[order]
+        
+        header = header or []
+        names = [header[i] if i < len(header) and header[i] else f'Serie {i}'
+                 for i in range(1, n_columns)]
+        return SeriesData(table[:, 0], table[:, 1:].T, names)
+    
+    @staticmethod
+    def _process_named_series(chart_data):
+        """
+        Convierte "Nombre: v1,v2 | Nombre: v1,v2" en un SeriesData
+        (o en (data,) si solo hay un bloque)
+        """
+        names = []
+        columns = []
+        for i, block in enumerate(chart_data.split('|')):
+            if not block.strip():
+                continue
+            if ':' in block:
+                name, values = block.split(':', 1)
+                name = name.strip() or f'Serie {i+1}'
+            else:
+                name, values = f'Serie {i+1}', block
+            
+            column = []
+            for value in values.split(','):
+                if value.strip():
+                    try:
+                        column.append(float(value.strip()))
+                    except ValueError:
+                        continue
+            
+            if column:
+                names.append(name)
+                columns.append(column)
+        
+        if len(columns) == 0:
+            raise ValueError("No se pudieron procesar las series")
+        
+        # Un único bloque con nombre es una serie normal de una dimensión
+        if len(columns) == 1:
+            return (np.array(columns[0]),)
+        
+        # Rellenar con NaN para obtener un único array 2-D
+        n_points = max(len(column) for column in columns)
+        values = np.full((len(columns), n_points), np.nan)
+        for i, column in enumerate(columns):
+            values[i, :len(column)] = column
+        
+        return SeriesData(np.arange(n_points, dtype=float), values, names)
+    
     @staticmethod
     def process_labels(chart_labels):
         """Procesa las etiquetas de entrada"""
@@ -120,6 +282,10 @@ class DataProcessor:
         if not data_result:
             return False
         
+        if isinstance(data_result, SeriesData):
+            # Varias series solo para líneas, dispersión, barras y caja
+            return chart_type in ['line', 'scatter', 'bar', 'box'] and data_result.values.shape[1] >= 1
+        
         if chart_type in ['line', 'scatter'] and len(data_result) == 1:
             # Para líneas y scatter, si solo hay una dimensión, está bien
             return len(data_result[0]) >= 2
@@ -132,6 +298,563 @@ class DataProcessor:
         
         return True
 
+# ===========================================
+# MOTOR DE AJUSTE DE CURVAS
+# ===========================================
+
+class _LeastSquaresSums:
+    """
+    Estadísticos suficientes de mínimos cuadrados para z = Σ β_k·u^k
+    
+    Acumula XᵀX, Xᵀz, zᵀz, Σz y n de varias series a la vez (eje inicial de
+    series). z se centra respecto a la media de la primera carga (u llega ya
+    centrada), así las sumas no sufren cancelación catastrófica. Añadir datos
+    solo actualiza las sumas y el reajuste resuelve un sistema pequeño por serie.
+    """
+    
+    def __init__(self, n_series, degree):
+        self.degree = degree
+        n_params = degree + 1
+        self.xtx = np.zeros((n_series, n_params, n_params))
+        self.xtz = np.zeros((n_series, n_params))
+        self.ztz = np.zeros(n_series)
+        self.sz = np.zeros(n_series)
+        self.n = np.zeros(n_series)
+        self.z_shift = None
+    
+    def _design(self, u):
+        return u[..., None] ** np.arange(self.degree + 1)
+    
+    def add(self, u, z, valid):
+        """Añade arrays (n_series, n_puntos); los puntos no válidos se ignoran"""
+        weights = valid.astype(float)
+        u = np.where(valid, u, 0.0)
+        z = np.where(valid, z, 0.0)
+        if self.z_shift is None:
+            self.z_shift = z.sum(axis=1) / np.maximum(weights.sum(axis=1), 1)
+        z = (z - self.z_shift[:, None]) * weights
+        
+        design = self._design(u) * weights[..., None]
+        self.xtx += np.einsum('snp,snq->spq', design, design)
+        self.xtz += np.einsum('snp,sn->sp', design, z)
+        self.ztz += (z ** 2).sum(axis=1)
+        self.sz += z.sum(axis=1)
+        self.n += weights.sum(axis=1)
+    
+    def _variance_z(self):
+        """Σ(z - z̄)² y máscara de series donde z realmente varía"""
+        ss_tot = self.ztz - self.sz ** 2 / np.maximum(self.n, 1)
+        # Tolerancia relativa a zᵀz: no depende de la escala de los datos
+        return ss_tot, (self.ztz > 0) & (ss_tot > 1e-12 * self.ztz)
+    
+    def solve(self):
+        """Devuelve (coeficientes, suma de residuos², R²) de cada serie"""
+        beta = np.einsum('spq,sq->sp', np.linalg.pinv(self.xtx), self.xtz)
+        ss_res = np.maximum(self.ztz - np.einsum('sp,sp->s', beta, self.xtz), 0.0)
+        ss_tot, varies = self._variance_z()
+        r_squared = np.where(varies, 1 - ss_res / np.where(varies, ss_tot, 1), 0.0)
+        beta[:, 0] += self.z_shift
+        return beta, ss_res, r_squared
+    
+    def correlation(self):
+        """Coeficiente de Pearson entre u y z (solo grado 1)"""
+        n = np.maximum(self.n, 1)
+        cov = self.xtz[:, 1] - self.xtx[:, 0, 1] * self.sz / n
+        var_u = self.xtx[:, 1, 1] - self.xtx[:, 0, 1] ** 2 / n
+        var_z, varies = self._variance_z()
+        valid = varies & (var_u > 0)
+        return np.where(valid, cov / np.sqrt(np.where(valid, var_u * var_z, 1)), 0.0)
+    
+    def band_halfwidth(self, u, ss_res, confidence):
+        """Semiancho del intervalo de confianza de la media para u (n_series, m)"""
+        dof = self.n - (self.degree + 1)
+        s2 = np.where(dof > 0, ss_res / np.maximum(dof, 1), 0.0)
+        cov = s2[:, None, None] * np.linalg.pinv(self.xtx)
+        design = self._design(u)
+        se = np.sqrt(np.maximum(np.einsum('smp,spq,smq->sm', design, cov, design), 0.0))
+        return stats.t.ppf((1 + confidence) / 2, np.maximum(dof, 1))[:, None] * se
+
+class CurveFitter:
+    """
+    Motor de ajuste compartido por las gráficas de líneas y de dispersión
+    
+    Modelos disponibles:
+        - polynomial:  y = Σ c_k·x^k (grado configurable)
+        - exponential: y = a·e^(b·x), ajustado sobre ln(y) con y > 0
+        - logistic:    y = L / (1 + e^(-k·(x - x0))), con 0 < y < L
+    
+    Ajusta una serie (y 1-D) o varias a la vez (y 2-D, una fila por serie y
+    NaN como relleno); en el segundo caso cada resultado es un array con una
+    entrada por serie. Los modelos polinómico y exponencial usan solo
+    estadísticos suficientes acumulados. El logístico conserva los datos para
+    elegir la capacidad L de cada serie en una rejilla vectorizada.
+    """
+    
+    MODELS = ('polynomial', 'exponential', 'logistic')
+    SPECS = 'linear, poly2, poly3..., exponential, logistic'
+    _cache = OrderedDict()
+    _cache_size = 32
+    
+    def __init__(self, model='polynomial', degree=1, capacity=None):
+        if model not in self.MODELS:
+            raise ValueError(f"Modelo de ajuste '{model}' no reconocido")
+        self.model = model
+        self.degree = degree if model == 'polynomial' else 1
+        self.capacity = capacity
+        self._batched = None
+        self._sums = None
+        self._n = None
+        self._shift = None      # centrado de x por serie para un sistema bien condicionado
+        self._chunks = []       # datos (u, y, válidos) del modelo logístico
+        self._result = None
+    
+    @classmethod
+    def from_spec(cls, spec):
+        """
+        Crea un ajustador a partir de un texto: 'linear', 'poly2', 'poly3',
+        'exponential' o 'logistic' (también en español)
+        """
+        spec = (spec or 'linear').lower().strip()
+        if spec in ('linear', 'lineal'):
+            return cls('polynomial', 1)
+        if spec.startswith('poly') or spec.startswith('polinomi'):
+            digits = ''.join(ch for ch in spec if ch.isdigit())
+            return cls('polynomial', int(digits) if digits else 2)
+        if spec in ('exponential', 'exponencial'):
+            return cls('exponential')
+        if spec in ('logistic', 'logistica', 'logística'):
+            return cls('logistic')
+        raise ValueError(f"Modelo de ajuste '{spec}' no reconocido")
+    
+    @classmethod
+    def cached(cls, x_data, y_data, spec='linear'):
+        """
+        Devuelve una copia de un ajuste ya resuelto para estos datos,
+        reutilizando el cálculo de renderizados anteriores. Devuelve None
+        si ninguna serie tiene datos suficientes.
+        """
+        x_data = np.asarray(x_data, dtype=float)
+        y_data = np.asarray(y_data, dtype=float)
+        key = (spec, x_data.shape, y_data.shape, x_data.tobytes(), y_data.tobytes())
+        if key not in cls._cache:
+            fitter = cls.from_spec(spec).add(x_data, y_data)
+            cls._cache[key] = fitter.fit() if np.any(fitter.has_fit) else None
+            if len(cls._cache) > cls._cache_size:
+                cls._cache.popitem(last=False)
+        cls._cache.move_to_end(key)
+        # Copia: quien la reciba puede añadir datos sin alterar la caché
+        return copy.deepcopy(cls._cache[key])
+    
+    def _out(self, values):
+        """Devuelve el resultado por serie, o el escalar si solo hay una"""
+        return values if self._batched else values[0]
+    
+    @property
+    def n_params(self):
+        if self.model == 'logistic':
+            return 2 if self.capacity else 3
+        return self.degree + 1
+    
+    @property
+    def n(self):
+        return self._out(self._n)
+    
+    @property
+    def has_fit(self):
+        """Indica si cada serie tiene datos suficientes para el modelo"""
+        return self._out(self._n >= self.n_params)
+    
+    @property
+    def is_linear(self):
+        return self.model == 'polynomial' and self.degree == 1
+    
+    def add(self, x_data, y_data):
+        """
+        Añade datos al ajuste; los puntos no válidos para el modelo se ignoran
+        
+        Args:
+            x_data: array (n_puntos,) compartido o (n_series, n_puntos)
+            y_data: array (n_puntos,) para una serie o (n_series, n_puntos)
+        """
+        y_data = np.asarray(y_data, dtype=float)
+        batched = y_data.ndim == 2
+        if self._batched is None:
+            self._batched = batched
+        elif batched != self._batched:
+            raise ValueError("No se pueden mezclar datos de una y de varias series")
+        
+        y_data = np.atleast_2d(y_data)
+        x_data = np.broadcast_to(np.asarray(x_data, dtype=float), y_data.shape)
+        valid = np.isfinite(x_data) & np.isfinite(y_data)
+        if self.model in ('exponential', 'logistic'):
+            valid &= y_data > 0
+        if self.model == 'logistic' and self.capacity:
+            valid &= y_data < self.capacity
+        
+        if self._shift is None:
+            count = np.maximum(valid.sum(axis=1), 1)
+            self._shift = np.where(valid, x_data, 0.0).sum(axis=1) / count
+            self._sums = _LeastSquaresSums(len(y_data), self.degree)
+            self._n = np.zeros(len(y_data))
+        
+        u = x_data - self._shift[:, None]
+        if self.model == 'logistic':
+            self._chunks.append((u, y_data, valid))
+        elif self.model == 'exponential':
+            self._sums.add(u, np.log(np.where(valid, y_data, 1.0)), valid)
+        else:
+            self._sums.add(u, y_data, valid)
+        
+        self._n = self._n + valid.sum(axis=1)
+        self._result = None
+        return self
+    
+    def fit(self):
+        """Resuelve el ajuste (solo si hay datos nuevos desde el último)"""
+        if self._result is not None:
+            return self
+        if self._shift is None or not np.any(self._n >= self.n_params):
+            raise ValueError("Datos insuficientes para el modelo de ajuste")
+        
+        if self.model == 'logistic':
+            self._fit_logistic()
+        else:
+            beta, ss_res, r_squared = self._sums.solve()
+            self._result = {'beta': beta, 'ss_res': ss_res, 'r_squared': r_squared,
+                            'sums': self._sums}
+        return self
+    
+    @staticmethod
+    def _logistic(u, capacity, k, x0):
+        """Curva logística evaluada en u = x - desplazamiento"""
+        return capacity / (1 + np.exp(-k * (u - x0)))
+    
+    def _fit_logistic(self):
+        """
+        Linealiza ln(L/y - 1) = a + b·u para elegir, por serie, la mejor L de
+        una rejilla y refina ese punto con mínimos cuadrados no lineales
+        """
+        u, y_data, valid = (np.concatenate(parts, axis=1) for parts in zip(*self._chunks))
+        n_series = len(y_data)
+        y_safe = np.where(valid, y_data, 1.0)
+        
+        if self.capacity:
+            candidates = np.full((n_series, 1), float(self.capacity))
+        else:
+            y_max = np.where(valid, y_data, 1.0).max(axis=1)
+            candidates = y_max[:, None] * (1 + np.geomspace(1e-6, 3, 120))
+        
+        # Regresión lineal de todas las series y capacidades candidatas a la vez
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            z = np.log(candidates[:, :, None] / y_safe[:, None, :] - 1)
+            z_valid = np.where(valid[:, None, :], z, 0.0)
+            u_valid = np.where(valid, u, 0.0)
+            n = np.maximum(valid.sum(axis=1), 1)[:, None]
+            su = u_valid.sum(axis=1)[:, None]
+            var_u = (u_valid ** 2).sum(axis=1)[:, None] - su ** 2 / n
+            sz = z_valid.sum(axis=2)
+            suz = np.einsum('sgn,sn->sg', z_valid, u_valid)
+            b = np.where(var_u > 0, (suz - su * sz / n) / np.where(var_u > 0, var_u, 1), 0.0)
+            a = (sz - b * su) / n
+            predicted = candidates[:, :, None] / (1 + np.exp(a[:, :, None] + b[:, :, None] * u[:, None, :]))
+            sse = np.where(valid[:, None, :], (y_data[:, None, :] - predicted) ** 2, 0.0).sum(axis=2)
+        
+        rows = np.arange(n_series)
+        best = np.argmin(sse, axis=1)
+        sums = _LeastSquaresSums(n_series, 1)
+        sums.add(u, z[rows, best], valid)
+        beta, ss_res, _ = sums.solve()
+        capacity = candidates[rows, best].copy()
+        sse = sse[rows, best]
+        
+        # La linealización pesa demasiado los puntos cercanos a L: se refina
+        # cada serie en la escala de y partiendo de la solución de la rejilla
+        param_cov = [None] * n_series
+        for i in range(n_series):
+            if valid[i].sum() <= self.n_params or beta[i, 1] == 0:
+                continue
+            u_i, y_i = u[i, valid[i]], y_data[i, valid[i]]
+            k, x0 = -beta[i, 1], beta[i, 0] / -beta[i, 1]
+            try:
+                if self.capacity:
+                    model = lambda t, k, x0: self._logistic(t, capacity[i], k, x0)
+                    params, cov = curve_fit(model, u_i, y_i, p0=(k, x0))
+                    params = np.r_[capacity[i], params]
+                else:
+                    params, cov = curve_fit(self._logistic, u_i, y_i, p0=(capacity[i], k, x0))
+            except (RuntimeError, ValueError):
+                continue    # se conserva la solución de la rejilla
+            if not np.all(np.isfinite(cov)):
+                continue
+            capacity[i], k, x0 = params
+            beta[i] = [k * x0, -k]
+            sse[i] = np.sum((y_i - self._logistic(u_i, *params)) ** 2)
+            param_cov[i] = cov
+        
+        y_valid = np.where(valid, y_data, 0.0)
+        y_mean = y_valid.sum(axis=1) / n[:, 0]
+        ss_tot = np.where(valid, (y_data - y_mean[:, None]) ** 2, 0.0).sum(axis=1)
+        varies = ss_tot > 1e-12 * (y_valid ** 2).sum(axis=1)
+        self._result = {'beta': beta, 'ss_res': ss_res, 'sums': sums,
+                        'capacity': capacity, 'param_cov': param_cov,
+                        'dof': valid.sum(axis=1) - self.n_params,
+                        'r_squared': np.where(varies, 1 - sse / np.where(varies, ss_tot, 1), 0.0)}
+    
+    def _linear_predict(self, x_values):
+        """Evalúa la parte lineal del modelo: devuelve (u, z) de forma (n_series, m)"""
+        u = np.asarray(x_values, dtype=float)[None, :] - self._shift[:, None]
+        design = self._result['sums']._design(u)
+        return u, np.einsum('smp,sp->sm', design, self._result['beta'])
+    
+    def _from_linear(self, z):
+        """Transforma la escala lineal del ajuste a la escala de y"""
+        if self.model == 'exponential':
+            return np.exp(z)
+        if self.model == 'logistic':
+            return self._result['capacity'][:, None] / (1 + np.exp(z))
+        return z
+    
+    def predict(self, x_values):
+        self.fit()
+        return self._out(self._from_linear(self._linear_predict(x_values)[1]))
+    
+    def confidence_band(self, x_values, confidence=0.95):
+        """
+        Banda de confianza de la curva ajustada, calculada de forma vectorizada
+        
+        Returns:
+            tuple: (inferior, superior) evaluados en x_values
+        """
+        self.fit()
+        u, z = self._linear_predict(x_values)
+        half = self._result['sums'].band_halfwidth(u, self._result['ss_res'], confidence)
+        lower, upper = self._from_linear(z - half), self._from_linear(z + half)
+        if self.model == 'logistic':
+            # En el modelo logístico y decrece al crecer la escala lineal
+            lower, upper = upper, lower
+            self._logistic_band(u, lower, upper, confidence)
+        return self._out(lower), self._out(upper)
+    
+    def _logistic_band(self, u, lower, upper, confidence):
+        """
+        Sustituye la banda linealizada por la del método delta en la escala
+        de y para las series refinadas con mínimos cuadrados no lineales
+        """
+        for i, cov in enumerate(self._result['param_cov']):
+            if cov is None:
+                continue
+            capacity, k = self._result['capacity'][i], -self._result['beta'][i, 1]
+            x0 = self._result['beta'][i, 0] / k
+            growth = np.exp(-k * (u[i] - x0))
+            # Derivadas de la curva respecto a (L, k, x0)
+            gradient = np.stack([1 / (1 + growth),
+                                 capacity * growth * (u[i] - x0) / (1 + growth) ** 2,
+                                 -capacity * growth * k / (1 + growth) ** 2], axis=1)
+            if self.capacity:
+                gradient = gradient[:, 1:]
+            variance = np.einsum('mp,pq,mq->m', gradient, cov, gradient)
+            half = stats.t.ppf((1 + confidence) / 2, self._result['dof'][i]) * np.sqrt(np.maximum(variance, 0.0))
+            curve = capacity / (1 + growth)
+            lower[i], upper[i] = curve - half, curve + half
+    
+    @property
+    def r_squared(self):
+        """R² del ajuste (en escala ln y para el modelo exponencial, ver r_squared_label)"""
+        self.fit()
+        return self._out(self._result['r_squared'])
+    
+    @property
+    def r_squared_label(self):
+        return 'R² (ln y)' if self.model == 'exponential' else 'R²'
+    
+    @property
+    def coefficients(self):
+        """
+        Parámetros en la escala original de x:
+        polinomio de mayor a menor grado, (a, b) exponencial o (L, k, x0) logístico
+        """
+        self.fit()
+        beta = self._result['beta']
+        if self.model == 'polynomial':
+            coef = np.zeros_like(beta)
+            for i, shift in enumerate(self._shift):
+                shifted = np.polynomial.Polynomial(beta[i])(np.polynomial.Polynomial([-shift, 1]))
+                coef[i, :len(shifted.coef)] = shifted.coef
+            return self._out(coef[:, ::-1])
+        if self.model == 'exponential':
+            return self._out(np.stack([np.exp(beta[:, 0] - beta[:, 1] * self._shift), beta[:, 1]], axis=1))
+        k = -beta[:, 1]
+        x0 = self._shift + np.where(k != 0, beta[:, 0] / np.where(k != 0, k, 1), 0.0)
+        return self._out(np.stack([self._result['capacity'], k, x0], axis=1))
+    
+    @property
+    def correlation(self):
+        """Coeficiente de correlación de Pearson (solo para el ajuste lineal)"""
+        if not self.is_linear:
+            return None
+        self.fit()
+        return self._out(self._result['sums'].correlation())
+    
+    @property
+    def equation(self):
+        """Ecuación del ajuste lista para la leyenda (una por serie si hay varias)"""
+        coefficients = np.atleast_2d(self.coefficients)
+        equations = [self._format_equation(coef) for coef in coefficients]
+        return self._out(equations)
+    
+    def _format_equation(self, coef):
+        if self.model == 'exponential':
+            return f'y = {coef[0]:.3f}·e^({coef[1]:.3f}x)'
+        if self.model == 'logistic':
+            return f'y = {coef[0]:.3f} / (1 + e^(-{coef[1]:.3f}(x - {coef[2]:.3f})))'
+        if self.degree == 1:
+            return f'y = {coef[0]:.3f}x + {coef[1]:.3f}'
+        terms = []
+        for power, c in zip(range(self.degree, -1, -1), coef):
+            terms.append(f'{c:.3f}' + ('' if power == 0 else 'x' if power == 1 else f'x^{power}'))
+        return 'y = ' + ' + '.join(terms)
+
+# ===========================================
+# GESTIÓN DE MEMORIA DE FIGURAS
+# ===========================================
+
+class FigureManager:
+    """
+    Controla el ciclo de vida de las figuras creadas por ProfessionalCharts
+    
+    Con el backend Agg, plt.show() no cierra nada y las figuras quedan
+    registradas en pyplot. El gestor conserva las más recientes (para que
+    el navegador pueda capturarlas) y cierra las antiguas cuando se supera
+    el presupuesto de figuras abiertas o de artistas.
+    """
+    
+    def __init__(self, max_open_figures=3, max_artists=50000):
+        self.max_open_figures = max_open_figures
+        self.max_artists = max_artists
+        self._figures = []          # [(figura, n_artistas)] de más antigua a más reciente
+        self.created = 0
+        self.closed = 0
+        self.discarded = 0          # figuras cerradas por errores de renderizado
+        self.peak_open = 0
+    
+    @staticmethod
+    def count_artists(fig):
+        """Cuenta los artistas de una figura (ejes, líneas, textos, parches...)"""
+        return len(fig.findobj())
+    
+    def _prune(self):
+        """Olvida las figuras que ya fueron cerradas fuera del gestor"""
+        self._figures = [(fig, n) for fig, n in self._figures
+                         if plt.fignum_exists(fig.number)]
+    
+    @property
+    def open_figures(self):
+        self._prune()
+        return len(self._figures)
+    
+    @property
+    def open_artists(self):
+        self._prune()
+        return sum(n for _, n in self._figures)
+    
+    def register(self, fig):
+        """Registra una figura terminada y aplica el presupuesto de memoria"""
+        self._prune()
+        self._figures.append((fig, self.count_artists(fig)))
+        self.created += 1
+        # Se registra antes de aplicar el presupuesto para reflejar la presión real
+        self.peak_open = max(self.peak_open, len(self._figures))
+        self.enforce_budget()
+    
+    def discard(self, fig):
+        """Cierra una figura (o número de figura) que no llegó a completarse"""
+        plt.close(fig)
+        self.created += 1
+        self.discarded += 1
+        self.closed += 1
+    
+    def enforce_budget(self):
+        """Cierra las figuras más antiguas hasta respetar el presupuesto"""
+        # La figura más reciente nunca se cierra: es la que se va a capturar
+        while len(self._figures) > 1 and (
+                len(self._figures) > self.max_open_figures or
+                sum(n for _, n in self._figures) > self.max_artists):
+            fig, _ = self._figures.pop(0)
+            plt.close(fig)
+            self.closed += 1
+    
+    def close_all(self):
+        """Cierra todas las figuras gestionadas"""
+        self._prune()
+        for fig, _ in self._figures:
+            plt.close(fig)
+            self.closed += 1
+        self._figures = []
+    
+    def leak_report(self, verbose=True):
+        """
+        Genera un informe del uso de memoria de las figuras
+        
+        Returns:
+            dict: contadores del gestor y figuras de pyplot no gestionadas
+        """
+        self._prune()
+        managed = {fig.number for fig, _ in self._figures}
+        unmanaged = [num for num in plt.get_fignums() if num not in managed]
+        report = {
+            'open_figures': len(self._figures),
+            'open_artists': sum(n for _, n in self._figures),
+            'max_open_figures': self.max_open_figures,
+            'max_artists': self.max_artists,
+            'peak_open_figures': self.peak_open,
+            'created': self.created,
+            'closed': self.closed,
+            'discarded': self.discarded,
+            'unmanaged_figures': unmanaged
+        }
+        
+        if verbose:
+            print("🧠 Informe de memoria de figuras")
+            print(f"   Figuras abiertas: {report['open_figures']}/{self.max_open_figures} "
+                  f"(máximo alcanzado: {self.peak_open})")
+            print(f"   Artistas abiertos: {report['open_artists']}/{self.max_artists}")
+            print(f"   Creadas: {self.created} | Cerradas: {self.closed} | "
+                  f"Descartadas por error: {self.discarded}")
+            if unmanaged:
+                print(f"⚠️ Figuras de pyplot sin gestionar (posibles fugas): {unmanaged}")
+        
+        return report
+
+# Gestor compartido: generate_visualization crea un ProfessionalCharts por llamada
+figure_manager = FigureManager()
+
+def managed_render(method):
+    """
+    Decorador para los métodos create_* de ProfessionalCharts
+    
+    Las figuras creadas durante el renderizado se registran en el gestor si
+    la gráfica se genera con éxito y se cierran si falla o lanza una excepción.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        before = set(plt.get_fignums())
+        success = False
+        try:
+            success = method(self, *args, **kwargs)
+            return success
+        finally:
+            new_numbers = [num for num in plt.get_fignums() if num not in before]
+            if success and new_numbers:
+                # Se registran todas las figuras nuevas sin cambiar la figura activa;
+                # la actual va al final para que el presupuesto nunca la cierre
+                current = plt.gcf().number
+                for num in sorted(new_numbers, key=lambda num: num == current):
+                    self.figures.register(Gcf.figs[num].canvas.figure)
+            else:
+                for num in new_numbers:
+                    self.figures.discard(num)
+    return wrapper
+
 # ===========================================
 # GENERADORES DE GRÁFICAS PROFESIONALES
 # ===========================================
@@ -139,15 +862,20 @@ class DataProcessor:
 class ProfessionalCharts:
     """Clase principal para generar gráficas profesionales"""
     
-    def __init__(self):
+    def __init__(self, figures=None):
         self.processor = DataProcessor()
+        self.figures = figures or figure_manager
     
-    def create_line_chart(self, chart_data, chart_labels, chart_title):
+    @managed_render
+    def create_line_chart(self, chart_data, chart_labels, chart_title, fit='linear'):
         """Crea una gráfica de líneas profesional con análisis avanzado"""
         data_result = self.processor.process_data(chart_data)
         if not data_result:
             return False
         
+        if isinstance(data_result, SeriesData):
+            return self._create_multi_line_chart(data_result, chart_labels, chart_title, fit)
+        
         fig, ax = plt.subplots(figsize=(12, 8))
         
         if len(data_result) == 2:
@@ -159,16 +887,17 @@ class ProfessionalCharts:
                           label='Datos')[0]
             
             # Línea de tendencia
-            if len(x_data) > 1:
-                z = np.polyfit(x_data, y_data, 1)
-                p = np.poly1d(z)
-                ax.plot(x_data, p(x_data), "--", alpha=0.7, color='red', 
-                       linewidth=2, label=f'Tendencia: y = {z[0]:.3f}x + {z[1]:.3f}')
-            
-            # Calcular y mostrar correlación
-            if len(x_data) > 1:
-                correlation = np.corrcoef(x_data, y_data)[0, 1]
-                ax.text(0.05, 0.95, f'Correlación: {correlation:.3f}', 
+            fitter = CurveFitter.cached(x_data, y_data, fit)
+            if fitter:
+                x_grid, curve, band = self._fit_curves(fitter, x_data)
+                self._plot_fit(ax, x_grid, curve, band, f'Tendencia: {fitter.equation}',
+                               band_label='IC 95%', linestyle='--', alpha=0.7,
+                               color='red', linewidth=2)
+                
+                # Mostrar correlación (o R² en modelos no lineales)
+                fit_text = (f'Correlación: {fitter.correlation:.3f}' if fitter.is_linear
+                            else f'{fitter.r_squared_label}: {fitter.r_squared:.3f}')
+                ax.text(0.05, 0.95, fit_text, 
                        transform=ax.transAxes, fontsize=12, 
                        bbox=dict(boxstyle="round,pad=0.3", facecolor='lightblue', alpha=0.7))
             
@@ -205,12 +934,16 @@ class ProfessionalCharts:
         plt.show()
         return True
     
+    @managed_render
     def create_bar_chart(self, chart_data, chart_labels, chart_title):
         """Crea una gráfica de barras profesional con estadísticas"""
         data_result = self.processor.process_data(chart_data)
         if not data_result:
             return False
         
+        if isinstance(data_result, SeriesData):
+            return self._create_multi_bar_chart(data_result, chart_labels, chart_title)
+        
         fig, ax = plt.subplots(figsize=(12, 8))
         
         if len(data_result) == 2:
@@ -272,12 +1005,17 @@ class ProfessionalCharts:
         plt.show()
         return True
     
+    @managed_render
     def create_histogram(self, chart_data, chart_labels, chart_title):
         """Crea un histograma profesional con análisis estadístico completo"""
         data_result = self.processor.process_data(chart_data)
         if not data_result:
             return False
         
+        if isinstance(data_result, SeriesData):
+            print("❌ Este tipo de gráfica no admite varias series")
+            return False
+        
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
         
         # Seleccionar datos para el histograma
@@ -349,12 +1087,16 @@ class ProfessionalCharts:
         plt.show()
         return True
     
-    def create_scatter_plot(self, chart_data, chart_labels, chart_title):
+    @managed_render
+    def create_scatter_plot(self, chart_data, chart_labels, chart_title, fit='linear'):
         """Crea una gráfica de dispersión profesional con análisis de correlación"""
         data_result = self.processor.process_data(chart_data)
         if not data_result:
             return False
         
+        if isinstance(data_result, SeriesData):
+            return self._create_multi_scatter_plot(data_result, chart_labels, chart_title, fit)
+        
         fig, ax = plt.subplots(figsize=(12, 8))
         
         if len(data_result) == 2:
@@ -367,22 +1109,21 @@ class ProfessionalCharts:
             plt.colorbar(scatter, ax=ax, label='Índice de datos')
             
             # Línea de regresión
-            if len(x_data) > 1:
-                z = np.polyfit(x_data, y_data, 1)
-                p = np.poly1d(z)
-                ax.plot(x_data, p(x_data), "r--", alpha=0.8, linewidth=3, 
-                       label=f'Regresión: y = {z[0]:.3f}x + {z[1]:.3f}')
-                
-                # Calcular R²
-                y_pred = p(x_data)
-                ss_res = np.sum((y_data - y_pred) ** 2)
-                ss_tot = np.sum((y_data - np.mean(y_data)) ** 2)
-                r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
+            fitter = CurveFitter.cached(x_data, y_data, fit)
+            if fitter:
+                x_grid, curve, band = self._fit_curves(fitter, x_data)
+                self._plot_fit(ax, x_grid, curve, band, f'Regresión: {fitter.equation}',
+                               band_label='IC 95%', linestyle='--', color='red',
+                               alpha=0.8, linewidth=3)
                 
                 # Correlación y estadísticas
-                correlation = np.corrcoef(x_data, y_data)[0, 1]
-                stats_text = f'Correlación: {correlation:.3f}\nR²: {r_squared:.3f}\n'
-                stats_text += f'Pendiente: {z[0]:.3f}\nIntercepto: {z[1]:.3f}'
+                if fitter.is_linear:
+                    slope, intercept = fitter.coefficients
+                    stats_text = f'Correlación: {fitter.correlation:.3f}\nR²: {fitter.r_squared:.3f}\n'
+                    stats_text += f'Pendiente: {slope:.3f}\nIntercepto: {intercept:.3f}'
+                else:
+                    stats_text = f'Modelo: {fitter.model}\n{fitter.r_squared_label}: {fitter.r_squared:.3f}\n'
+                    stats_text += fitter.equation
                 
                 ax.text(0.05, 0.95, stats_text, transform=ax.transAxes, 
                        bbox=dict(boxstyle="round,pad=0.3", facecolor='lightblue', alpha=0.8),
@@ -401,11 +1142,12 @@ class ProfessionalCharts:
             plt.colorbar(scatter, ax=ax, label='Índice')
             
             # Línea de tendencia
-            if len(data) > 1:
-                z = np.polyfit(x_indices, data, 1)
-                p = np.poly1d(z)
-                ax.plot(x_indices, p(x_indices), "r--", alpha=0.8, linewidth=3, 
-                       label=f'Tendencia: y = {z[0]:.3f}x + {z[1]:.3f}')
+            fitter = CurveFitter.cached(x_indices, data, fit)
+            if fitter:
+                x_grid, curve, band = self._fit_curves(fitter, x_indices)
+                self._plot_fit(ax, x_grid, curve, band, f'Tendencia: {fitter.equation}',
+                               band_label='IC 95%', linestyle='--', color='red',
+                               alpha=0.8, linewidth=3)
             
             ax.set_xlabel('Índice', fontweight='bold', fontsize=14)
             ax.set_ylabel('Valor', fontweight='bold', fontsize=14)
@@ -419,12 +1161,17 @@ class ProfessionalCharts:
         plt.show()
         return True
     
+    @managed_render
     def create_pie_chart(self, chart_data, chart_labels, chart_title):
         """Crea una gráfica circular profesional con efectos visuales"""
         data_result = self.processor.process_data(chart_data)
         if not data_result:
             return False
         
+        if isinstance(data_result, SeriesData):
+            print("❌ Este tipo de gráfica no admite varias series")
+            return False
+        
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
         
         # Seleccionar datos
@@ -488,12 +1235,16 @@ class ProfessionalCharts:
         plt.show()
         return True
     
+    @managed_render
     def create_box_plot(self, chart_data, chart_labels, chart_title):
         """Crea un diagrama de caja profesional con análisis estadístico completo"""
         data_result = self.processor.process_data(chart_data)
         if not data_result:
             return False
         
+        if isinstance(data_result, SeriesData):
+            return self._create_multi_box_plot(data_result, chart_labels, chart_title)
+        
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
         
         # Seleccionar datos
@@ -560,6 +1311,207 @@ class ProfessionalCharts:
         plt.tight_layout()
         plt.show()
         return True
+    
+    # -------------------------------------------
+    # Curvas de ajuste (líneas y dispersión)
+    # -------------------------------------------
+    
+    @staticmethod
+    def _fit_curves(fitter, x_data):
+        """
+        Evalúa la curva y su banda de confianza del 95% en una rejilla
+        (arrays por serie si el ajuste es de varias series)
+        """
+        x_grid = np.linspace(np.nanmin(x_data), np.nanmax(x_data), 200)
+        return x_grid, fitter.predict(x_grid), fitter.confidence_band(x_grid)
+    
+    @staticmethod
+    def _plot_fit(ax, x_grid, curve, band, label, band_label=None, **line_kwargs):
+        """Dibuja una curva ajustada y su banda de confianza"""
+        line = ax.plot(x_grid, curve, label=label, **line_kwargs)[0]
+        ax.fill_between(x_grid, band[0], band[1], color=line.get_color(), alpha=0.15,
+                        label=band_label)
+        return line
+    
+    # -------------------------------------------
+    # Variantes para varias series (SeriesData)
+    # -------------------------------------------
+    
+    def _plot_series_fit(self, ax, fitter, curves, i, x_data, label, **line_kwargs):
+        """Dibuja el ajuste de la serie i limitado al rango de sus datos"""
+        x_grid, curve, (lower, upper) = curves
+        within = (x_grid >= x_data.min()) & (x_grid <= x_data.max())
+        self._plot_fit(ax, x_grid[within], curve[i, within],
+                       (lower[i, within], upper[i, within]),
+                       f'{label}: {fitter.equation[i]}', **line_kwargs)
+    
+    def _set_series_ticks(self, ax, series, chart_labels):
+        """Usa las etiquetas como marcas del eje X si cubren todos los puntos"""
+        labels = self.processor.process_labels(chart_labels)
+        if labels and len(labels) >= len(series.x):
+            ax.set_xticks(series.x)
+            ax.set_xticklabels(labels[:len(series.x)], rotation=45, ha='right')
+    
+    def _create_multi_line_chart(self, series, chart_labels, chart_title, fit='linear'):
+        """Dibuja todas las series y sus tendencias en una sola figura"""
+        fig, ax = plt.subplots(figsize=(12, 8))
+        
+        # Ajuste de todas las series en una sola pasada del motor compartido
+        fitter = CurveFitter.cached(series.x, series.values, fit)
+        curves = self._fit_curves(fitter, series.x) if fitter else None
+        
+        for i, name in enumerate(series.names):
+            x_data, y_data = series.series(i)
+            line = ax.plot(x_data, y_data, marker='o', linewidth=3, markersize=8,
+                           markerfacecolor='white', markeredgewidth=2, alpha=0.8,
+                           label=name)[0]
+            if fitter and fitter.has_fit[i]:
+                self._plot_series_fit(ax, fitter, curves, i, x_data, f'Tendencia {name}',
+                                      linestyle='--', alpha=0.7, color=line.get_color(),
+                                      linewidth=2)
+        
+        if fitter:
+            # r solo tiene sentido para la recta; en otros modelos se muestra R²
+            if fitter.is_linear:
+                title, values = 'Correlación', fitter.correlation
+                rows = [f'{name}: r = {value:.3f}' for name, value in zip(series.names, values)]
+            else:
+                title, values = f'Ajuste {fitter.model}', fitter.r_squared
+                rows = [f'{name}: {fitter.r_squared_label} = {value:.3f}'
+                        for name, value in zip(series.names, values)]
+            rows = [row for row, ok in zip(rows, fitter.has_fit) if ok]
+            ax.text(0.05, 0.95, '\n'.join([title] + rows), transform=ax.transAxes,
+                    fontsize=11, verticalalignment='top',
+                    bbox=dict(boxstyle="round,pad=0.3", facecolor='lightblue', alpha=0.7))
+        
+        self._set_series_ticks(ax, series, chart_labels)
+        ax.set_xlabel('X', fontweight='bold', fontsize=14)
+        ax.set_ylabel('Y', fontweight='bold', fontsize=14)
+        ax.set_title(chart_title or 'Gráfica de Líneas Profesional',
+                     fontweight='bold', fontsize=16, pad=20)
+        ax.legend()
+        ax.grid(True, alpha=0.3, linestyle='--')
+        
+        plt.tight_layout()
+        plt.show()
+        return True
+    
+    def _create_multi_bar_chart(self, series, chart_labels, chart_title):
+        """Dibuja barras agrupadas por categoría, una barra por serie"""
+        fig, ax = plt.subplots(figsize=(12, 8))
+        
+        n_series, n_points = series.values.shape
+        x_pos = np.arange(n_points)
+        width = 0.8 / n_series
+        offsets = (np.arange(n_series) - (n_series - 1) / 2) * width
+        means = np.nanmean(series.values, axis=1)
+        colors = plt.cm.viridis(np.linspace(0, 1, n_series))
+        
+        for i, name in enumerate(series.names):
+            ax.bar(x_pos + offsets[i], series.values[i], width=width, alpha=0.8,
+                   color=colors[i], edgecolor='black', linewidth=0.8,
+                   label=f'{name} (Promedio: {means[i]:.2f})')
+        
+        labels = self.processor.process_labels(chart_labels)
+        ax.set_xticks(x_pos)
+        if labels and len(labels) >= n_points:
+            ax.set_xticklabels(labels[:n_points], rotation=45, ha='right')
+        else:
+            ax.set_xticklabels([f'X={x:.1f}' for x in series.x], rotation=45, ha='right')
+        
+        ax.set_title(chart_title or 'Gráfica de Barras Profesional',
+                     fontweight='bold', fontsize=16, pad=20)
+        ax.set_xlabel('Categorías', fontweight='bold', fontsize=14)
+        ax.set_ylabel('Valores', fontweight='bold', fontsize=14)
+        ax.legend()
+        ax.grid(True, alpha=0.3, axis='y', linestyle='--')
+        
+        plt.tight_layout()
+        plt.show()
+        return True
+    
+    def _create_multi_scatter_plot(self, series, chart_labels, chart_title, fit='linear'):
+        """Dibuja la dispersión y regresión de todas las series en una figura"""
+        fig, ax = plt.subplots(figsize=(12, 8))
+        
+        fitter = CurveFitter.cached(series.x, series.values, fit)
+        curves = self._fit_curves(fitter, series.x) if fitter else None
+        
+        for i, name in enumerate(series.names):
+            x_data, y_data = series.series(i)
+            scatter = ax.scatter(x_data, y_data, alpha=0.7, s=100,
+                                 edgecolors='black', linewidth=0.5, label=name)
+            if fitter and fitter.has_fit[i]:
+                self._plot_series_fit(ax, fitter, curves, i, x_data, f'Regresión {name}',
+                                      linestyle='--', alpha=0.8, linewidth=3,
+                                      color=scatter.get_facecolor()[0])
+        
+        if fitter:
+            if fitter.is_linear:
+                rows = [f'{name}: r = {r:.3f}, R² = {r2:.3f}'
+                        for name, r, r2 in zip(series.names, fitter.correlation, fitter.r_squared)]
+            else:
+                rows = [f'{name}: {fitter.r_squared_label} = {r2:.3f}'
+                        for name, r2 in zip(series.names, fitter.r_squared)]
+            rows = [row for row, ok in zip(rows, fitter.has_fit) if ok]
+            ax.text(0.05, 0.95, '\n'.join(rows), transform=ax.transAxes,
+                    bbox=dict(boxstyle="round,pad=0.3", facecolor='lightblue', alpha=0.8),
+                    verticalalignment='top', fontsize=11)
+        
+        self._set_series_ticks(ax, series, chart_labels)
+        ax.set_xlabel('X', fontweight='bold', fontsize=14)
+        ax.set_ylabel('Y', fontweight='bold', fontsize=14)
+        ax.set_title(chart_title or 'Gráfica de Dispersión Profesional',
+                     fontweight='bold', fontsize=16, pad=20)
+        ax.legend()
+        ax.grid(True, alpha=0.3, linestyle='--')
+        
+        plt.tight_layout()
+        plt.show()
+        return True
+    
+    def _create_multi_box_plot(self, series, chart_labels, chart_title):
+        """Dibuja un diagrama de caja por serie y compara sus estadísticas"""
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        
+        data_to_plot = [series.series(i)[1] for i in range(series.n_series)]
+        ax1.boxplot(data_to_plot, patch_artist=True,
+                    boxprops=dict(facecolor='lightblue', alpha=0.7, linewidth=2),
+                    medianprops=dict(color='red', linewidth=3),
+                    whiskerprops=dict(color='black', linewidth=2),
+                    capprops=dict(color='black', linewidth=2),
+                    flierprops=dict(marker='o', markerfacecolor='red',
+                                    markersize=8, alpha=0.7, markeredgecolor='black'))
+        
+        # Superponer puntos de datos de todas las series a la vez
+        positions = np.broadcast_to(np.arange(1, series.n_series + 1)[:, None],
+                                    series.values.shape)
+        jitter = positions + np.random.normal(0, 0.04, size=series.values.shape)
+        ax1.scatter(jitter[series.mask], series.values[series.mask],
+                    alpha=0.4, s=30, color='darkblue')
+        
+        ax1.set_xticks(np.arange(1, series.n_series + 1))
+        ax1.set_xticklabels(series.names)
+        ax1.set_title('Diagrama de Caja con Distribución', fontweight='bold', fontsize=14)
+        ax1.set_ylabel('Valores', fontweight='bold')
+        ax1.grid(True, alpha=0.3, axis='y')
+        
+        # Estadísticas descriptivas de todas las series en una sola pasada
+        stats_dict = series.box_statistics()
+        header = 'Estadística'.ljust(15) + ''.join(name[:10].rjust(11) for name in series.names)
+        rows = [key.ljust(15) + ''.join(f'{value:11.2f}' for value in values)
+                for key, values in stats_dict.items()]
+        ax2.axis('off')
+        ax2.text(0.0, 1.0, '\n'.join([header] + rows), transform=ax2.transAxes,
+                 family='monospace', verticalalignment='top', fontsize=10,
+                 bbox=dict(boxstyle="round,pad=0.4", facecolor='wheat', alpha=0.9))
+        ax2.set_title('Estadísticas Comparativas', fontweight='bold', fontsize=14)
+        
+        plt.suptitle(chart_title or 'Análisis de Caja Profesional',
+                     fontweight='bold', fontsize=16)
+        plt.tight_layout()
+        plt.show()
+        return True
 
 # ===========================================
 # FUNCIÓN PRINCIPAL DE INTERFAZ
@@ -579,6 +1531,7 @@ def generate_visualization():
         chart_data = globals().get('chart_data', '').strip()
         chart_labels = globals().get('chart_labels', '').strip()
         chart_title = globals().get('chart_title', '').strip()
+        chart_fit = globals().get('chart_fit', 'linear').strip() or 'linear'
         
         # Validación de entrada
         if not chart_type:
@@ -589,6 +1542,13 @@ def generate_visualization():
             print("❌ Error: Datos no proporcionados")
             return False
         
+        try:
+            CurveFitter.from_spec(chart_fit)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            print(f"Modelos disponibles: {CurveFitter.SPECS}")
+            return False
+        
         print(f"🔄 Generando gráfica tipo '{chart_type}' con título '{chart_title}'...")
         
         # Mapeo de tipos de gráfica a métodos
@@ -603,7 +1563,9 @@ def generate_visualization():
         
         # Ejecutar el método correspondiente
         if chart_type in chart_methods:
-            success = chart_methods[chart_type](chart_data, chart_labels, chart_title)
+            # Las gráficas de líneas y dispersión admiten un modelo de ajuste
+            extra = {'fit': chart_fit} if chart_type in ('line', 'scatter') else {}
+            success = chart_methods[chart_type](chart_data, chart_labels, chart_title, **extra)
             if success:
                 print(f"✅ Gráfica '{chart_type}' generada exitosamente")
                 return True
@@ -662,31 +1624,89 @@ def test_all_visualizations():
             'data': '1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,25,30,35,40,45,50',
             'labels': '',
             'title': 'Análisis de Tiempos de Respuesta'
+        },
+        # Varias series: columnas con x compartida y series con nombre
+        'line (columnas)': {
+            'type': 'line',
+            'data': 'Semana,Grupo A,Grupo B,Grupo C;1,60,55,70;2,64,58,71;3,69,60,73;4,72,65,72;5,78,67,75',
+            'labels': '',
+            'title': 'Progreso de Tres Grupos'
+        },
+        'scatter (columnas)': {
+            'type': 'scatter',
+            'data': '1,2,3;2,4,5;3,5,9;4,8,10;5,9,14;6,12,15',
+            'labels': '',
+            'title': 'Dispersión de Dos Series'
+        },
+        'bar (series con nombre)': {
+            'type': 'bar',
+            'data': 'Grupo A: 10,15,23,11 | Grupo B: 12,18,20,16 | Grupo C: 8,11,25',
+            'labels': 'Ene,Feb,Mar,Abr',
+            'title': 'Ventas por Grupo'
+        },
+        'box (series con nombre)': {
+            'type': 'box',
+            'data': 'Grupo A: 1,3,4,5,7,8,12 | Grupo B: 2,4,6,6,7,9 | Grupo C: 5,8,9,10,14,20,25,30',
+            'labels': '',
+            'title': 'Comparación de Tiempos de Respuesta'
+        },
+        # Modelos de ajuste del motor compartido
+        'line (poly2)': {
+            'type': 'line',
+            'fit': 'poly2',
+            'data': '0,1;1,0.5;2,1.8;3,4.2;4,9.1;5,15.8;6,25.3',
+            'labels': '',
+            'title': 'Trayectoria Cuadrática'
+        },
+        'scatter (exponencial)': {
+            'type': 'scatter',
+            'fit': 'exponencial',
+            'data': '0,100;1,148;2,221;3,330;4,490;5,735;6,1100',
+            'labels': '',
+            'title': 'Crecimiento de una Población de Bacterias'
+        },
+        'scatter (logistica)': {
+            'type': 'scatter',
+            'fit': 'logistica',
+            'data': '0,2;1,4;2,9;3,18;4,30;5,40;6,46;7,49;8,50',
+            'labels': '',
+            'title': 'Difusión de un Rumor'
+        },
+        'line (columnas, logistica)': {
+            'type': 'line',
+            'fit': 'logistica',
+            'data': 'Día,Escuela A,Escuela B;0,3,5;1,7,9;2,15,17;3,28,26;4,41,33;5,50,37;6,55,39',
+            'labels': '',
+            'title': 'Adopción en Dos Escuelas'
         }
     }
     
     chart_generator = ProfessionalCharts()
     
-    for chart_type, config in test_data.items():
-        print(f"\n📊 Probando gráfica tipo '{chart_type}'...")
+    for test_name, config in test_data.items():
+        chart_type = config.get('type', test_name)
+        print(f"\n📊 Probando gráfica '{test_name}'...")
         try:
             # Establecer variables globales como lo haría JavaScript
             globals()['chart_type'] = chart_type
             globals()['chart_data'] = config['data']
             globals()['chart_labels'] = config['labels']
             globals()['chart_title'] = config['title']
+            globals()['chart_fit'] = config.get('fit', 'linear')
             
             # Generar visualización
             success = generate_visualization()
             
             if success:
-                print(f"✅ Prueba '{chart_type}' exitosa")
+                print(f"✅ Prueba '{test_name}' exitosa")
             else:
-                print(f"❌ Prueba '{chart_type}' falló")
+                print(f"❌ Prueba '{test_name}' falló")
                 
         except Exception as e:
-            print(f"❌ Error en prueba '{chart_type}': {e}")
+            print(f"❌ Error en prueba '{test_name}': {e}")
     
+    figure_manager.leak_report()
+    figure_manager.close_all()
     print("\n🎉 Pruebas completadas")
 
 # ===========================================